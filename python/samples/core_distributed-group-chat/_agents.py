@@ -1,6 +1,6 @@
 import asyncio
 import random
-from typing import Awaitable, Callable, List
+from typing import Awaitable, Callable, List, Tuple
 from uuid import uuid4
 
 from _types import GroupChatMessage, MessageChunk, RequestToSpeak, UIAgentConfig
@@ -50,7 +50,9 @@ async def handle_request_to_speak(self, message: RequestToSpeak, ctx: MessageCon
         self._chat_history.append(
             UserMessage(content=f"Transferred to {self.id.type}, adopt the persona immediately.", source="system")
         )
-        completion = await self._model_client.create([self._system_message] + self._chat_history)
+        completion = await self._model_client.create(
+            [self._system_message] + self._chat_history, cancellation_token=ctx.cancellation_token
+        )
         assert isinstance(completion.content, str)
         self._chat_history.append(AssistantMessage(content=completion.content, source=self.id.type))
 
@@ -79,10 +81,15 @@ def __init__(
         self._model_client = model_client
         self._num_rounds = 0
         self._participant_topic_types = participant_topic_types
-        self._chat_history: List[GroupChatMessage] = []
+        # One formatted "source: content" line per group chat message, appended as messages arrive.
+        self._history_lines: List[str] = []
         self._max_rounds = max_rounds
         self.console = Console()
-        self._participant_descriptions = participant_descriptions
+        # The role lines only depend on the static participant list, so format them once.
+        self._participant_roles: List[Tuple[str, str]] = [
+            (topic_type, f"{topic_type}: {description}".strip())
+            for topic_type, description in zip(participant_topic_types, participant_descriptions, strict=True)
+        ]
         self._previous_participant_topic_type: str | None = None
         self._ui_config = ui_config
 
@@ -90,23 +97,18 @@ def __init__(
     async def handle_message(self, message: GroupChatMessage, ctx: MessageContext) -> None:
         assert isinstance(message.body, UserMessage)
 
-        self._chat_history.append(message.body)  # type: ignore[reportargumenttype,arg-type]
-
-        # Format message history.
-        messages: List[str] = []
-        for msg in self._chat_history:
-            if isinstance(msg.content, str):  # type: ignore[attr-defined]
-                messages.append(f"{msg.source}: {msg.content}")  # type: ignore[attr-defined]
-            elif isinstance(msg.content, list):  # type: ignore[attr-defined]
-                messages.append(f"{msg.source}: {', '.join(msg.content)}")  # type: ignore[attr-defined,reportUnknownArgumentType]
-        history = "\n".join(messages)
+        # Format message history. Earlier messages were formatted when they arrived, so only format the new one.
+        msg = message.body
+        if isinstance(msg.content, str):
+            self._history_lines.append(f"{msg.source}: {msg.content}")
+        elif isinstance(msg.content, list):
+            self._history_lines.append(f"{msg.source}: {', '.join(msg.content)}")  # type: ignore[arg-type,reportUnknownArgumentType]
+        history = "\n".join(self._history_lines)
         # Format roles.
         roles = "\n".join(
             [
-                f"{topic_type}: {description}".strip()
-                for topic_type, description in zip(
-                    self._participant_topic_types, self._participant_descriptions, strict=True
-                )
+                role
+                for topic_type, role in self._participant_roles
                 if topic_type != self._previous_participant_topic_type
             ]
         )
@@ -143,8 +145,9 @@ async def handle_message(self, message: GroupChatMessage, ctx: MessageContext) -
             return
 
         selected_topic_type: str
+        selection = completion.content.lower()
         for topic_type in self._participant_topic_types:
-            if topic_type.lower() in completion.content.lower():
+            if topic_type.lower() in selection:
                 selected_topic_type = topic_type
                 self._previous_participant_topic_type = selected_topic_type
                 self.console.print(
@@ -174,21 +177,26 @@ async def publish_message_to_ui(
     ui_config: UIAgentConfig,
 ) -> None:
     message_id = str(uuid4())
-    # Stream the message to UI
-    message_chunks = (
-        MessageChunk(message_id=message_id, text=token + " ", author=source, finished=False)
-        for token in user_message.split()
-    )
-    for chunk in message_chunks:
+    ui_topic_id = DefaultTopicId(type=ui_config.topic_type)
+    if ui_config.max_delay <= 0:
+        # No artificial streaming delay configured: send the whole message as one chunk.
         await runtime.publish_message(
-            chunk,
-            DefaultTopicId(type=ui_config.topic_type),
+            MessageChunk(message_id=message_id, text=user_message, author=source, finished=False),
+            ui_topic_id,
+        )
+    else:
+        # Stream the message to UI
+        message_chunks = (
+            MessageChunk(message_id=message_id, text=token + " ", author=source, finished=False)
+            for token in user_message.split()
         )
-        await asyncio.sleep(random.uniform(ui_config.min_delay, ui_config.max_delay))
+        for chunk in message_chunks:
+            await runtime.publish_message(chunk, ui_topic_id)
+            await asyncio.sleep(random.uniform(ui_config.min_delay, ui_config.max_delay))
 
     await runtime.publish_message(
         MessageChunk(message_id=message_id, text=" ", author=source, finished=True),
-        DefaultTopicId(type=ui_config.topic_type),
+        ui_topic_id,
     )
 
 
@@ -20,7 +20,7 @@ class RequestToSpeak(BaseModel):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageChunk:
     message_id: str
     text: str
@@ -1,6 +1,7 @@
+import asyncio
 import logging
 import os
-from typing import Any, Iterable, Type
+from typing import Any, Coroutine, Iterable, Type, TypeVar
 
 import yaml
 from _types import AppConfig
@@ -41,3 +42,15 @@ def set_all_log_levels(log_leve: int):
     for _, logger in logging.root.manager.loggerDict.items():
         if isinstance(logger, logging.Logger):  # Ensure it's actually a Logger object
             logger.setLevel(log_leve)  # Adjust to DEBUG or another level as needed
+
+
+T = TypeVar("T")
+
+
+def run_main(main: Coroutine[Any, Any, T]) -> T:
+    """Run `main` on uvloop when it is installed, otherwise with the default asyncio event loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
@@ -4,7 +4,7 @@
 
 from _agents import GroupChatManager, publish_message_to_ui, publish_message_to_ui_and_backend
 from _types import AppConfig, GroupChatMessage, MessageChunk, RequestToSpeak
-from _utils import get_serializers, load_config, set_all_log_levels
+from _utils import get_serializers, load_config, run_main, set_all_log_levels
 from autogen_core import (
     TypeSubscription,
 )
@@ -73,4 +73,4 @@ async def main(config: AppConfig):
 if __name__ == "__main__":
     set_all_log_levels(logging.ERROR)
     warnings.filterwarnings("ignore", category=UserWarning, message="Resolved model mismatch.*")
-    asyncio.run(main(load_config()))
+    run_main(main(load_config()))
@@ -1,7 +1,5 @@
-import asyncio
-
 from _types import HostConfig
-from _utils import load_config
+from _utils import load_config, run_main
 from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntimeHost
 from rich.console import Console
 from rich.markdown import Markdown
@@ -19,4 +17,4 @@ async def main(host_config: HostConfig):
 
 
 if __name__ == "__main__":
-    asyncio.run(main(load_config().host))
+    run_main(main(load_config().host))
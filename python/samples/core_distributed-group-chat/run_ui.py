@@ -18,20 +18,24 @@
 
 
 message_chunks: dict[str, Message] = {}  # type: ignore [reportUnknownVariableType]
+# Loaded on the first chat start and reused for later chats, so config.yaml is only read once per process.
+app_config: AppConfig | None = None
 
 
 async def send_cl_stream(msg: MessageChunk) -> None:
-    if msg.message_id not in message_chunks:
-        message_chunks[msg.message_id] = Message(content="", author=msg.author)
+    cl_msg = message_chunks.get(msg.message_id)  # type: ignore [reportUnknownVariableType]
+    if cl_msg is None:
+        cl_msg = message_chunks[msg.message_id] = Message(content="", author=msg.author)
 
     if not msg.finished:
-        await message_chunks[msg.message_id].stream_token(msg.text)  # type: ignore [reportUnknownVariableType]
+        await cl_msg.stream_token(msg.text)  # type: ignore [reportUnknownMemberType]
     else:
-        await message_chunks[msg.message_id].stream_token(msg.text)  # type: ignore [reportUnknownVariableType]
-        await message_chunks[msg.message_id].update()  # type: ignore [reportUnknownMemberType]
+        await cl_msg.stream_token(msg.text)  # type: ignore [reportUnknownMemberType]
+        await cl_msg.update()  # type: ignore [reportUnknownMemberType]
         await asyncio.sleep(3)
-        cl_msg = message_chunks[msg.message_id]  # type: ignore [reportUnknownVariableType]
         await cl_msg.send()  # type: ignore [reportUnknownMemberType]
+        # Keep the entry through the grace period above so chunks dispatched late still join this message.
+        message_chunks.pop(msg.message_id, None)
 
 
 async def main(config: AppConfig):
@@ -62,6 +66,9 @@ async def main(config: AppConfig):
 
 @cl.on_chat_start  # type: ignore
 async def start_chat():
+    global app_config
     set_all_log_levels(logging.ERROR)
     warnings.filterwarnings("ignore", category=UserWarning, message="Resolved model mismatch.*")
-    asyncio.run(main(load_config()))
+    if app_config is None:
+        app_config = load_config()
+    asyncio.run(main(app_config))